@@ -1,6 +1,8 @@
 # entities/component.py
 
 class Component:
+    __slots__ = ("name", "entity")
+
     def __init__(self, name):
         self.name = name
         self.entity = None  # will be assigned when attached
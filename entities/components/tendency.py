@@ -1,5 +1,7 @@
 # entities/components/tendency.py
 
+import numpy as np
+
 from ..component import Component
 
 '''
@@ -94,28 +96,87 @@ Tendencies describe resistance and attraction under pressure — not identity.
 
 '''
 
-class TendencyComponent(Component):
-    def __init__(self, tendencies=None):
-        super().__init__("tendency")
-        self.tendencies = tendencies or {
-            # Risk Sensitivity (Avoidance ↔ Seeking), How much danger am I willing to tolerate?
-            "risk": 0.5,
-
-            # Aggression Threshold (Passive ↔ Confrontational), When do I use force or coercion?
-            "aggression": 0.5,
+# Tendency axes, in GEO_BIAS_MATRIX column order
+TENDENCY_INDEX = {
+    "risk": 0,
+    "aggression": 1,
+    "social": 2,
+    "authority": 3,
+    "patience": 4,
+    "novelty": 5,
+}
+
+_DEFAULT_TENDENCIES = {
+    # Risk Sensitivity (Avoidance ↔ Seeking), How much danger am I willing to tolerate?
+    "risk": 0.5,
+
+    # Aggression Threshold (Passive ↔ Confrontational), When do I use force or coercion?
+    "aggression": 0.5,
+
+    # Social Orientation (Self ↔ Group), Whose outcome matters most?
+    "social": 0.5,
+
+    # Authority Orientation (Independent ↔ Conformist), Do I trust rules and hierarchy?
+    "authority": 0.5,
+
+    # Time Horizon (Impulsive ↔ Patient), Now or later?
+    "patience": 0.5,
+
+    # Novelty Orientation (Routine ↔ Exploratory), Do I stick to known patterns?
+    "novelty": 0.5,
+}
+
+# Geo pressure keys, in GEO_BIAS_MATRIX row order
+_GEO_KEYS = (
+    "resource_stability",
+    "environmental_threat",
+    "mobility_constraint",
+    "population_density",
+    "isolation_level",
+)
+
+# Geo pressure -> tendency coefficients, one row per pressure, columns follow TENDENCY_INDEX.
+#   risk, aggression, social, authority, patience, novelty
+GEO_BIAS_MATRIX = np.array([
+    # --- 1. Resource Stability ---
+    # Logic: Scarcity (negative stability) breeds impulsivity and caution.
+    # Abundance (positive stability) allows for long-term planning and social trust.
+    [-0.3, 0.0, 0.3, 0.0, 0.5, 0.0],
+
+    # --- 2. Environmental Threat ---
+    # Logic: High danger requires strict hierarchy and defensive readiness.
+    # Safety allows for exploration and lower aggression.
+    [0.0, 0.4, 0.0, 0.4, 0.0, -0.2],
+
+    # --- 3. Mobility Constraint ---
+    # Logic: Hard terrain (mountains/deep water) creates isolated, routine-based cultures.
+    # Easy terrain encourages exploration and risk-taking.
+    [-0.3, 0.0, 0.0, 0.0, 0.2, -0.2],
+
+    # --- 4. Population Density ---
+    # Logic: High density increases social friction and the need for laws.
+    [0.0, 0.3, 0.0, 0.4, 0.0, 0.2],
+
+    # --- 5. Isolation Level ---
+    # Logic: High isolation (no water/routes) forces local social cohesion.
+    # Connectivity (low isolation) encourages global authority and novelty.
+    [0.0, 0.0, 0.4, 0.3, 0.0, -0.4],
+])
+
+# Same coefficients per tendency (one 5-tuple per column) for the single-entity path
+_GEO_BIAS_COLUMNS = tuple(zip(TENDENCY_INDEX, zip(*GEO_BIAS_MATRIX.tolist())))
 
-            # Social Orientation (Self ↔ Group), Whose outcome matters most?
-            "social": 0.5,
 
-            # Authority Orientation (Independent ↔ Conformist), Do I trust rules and hierarchy?
-            "authority": 0.5,
+class TendencyComponent(Component):
+    __slots__ = ("tendencies",)
 
-            # Time Horizon (Impulsive ↔ Patient), Now or later?
-            "patience": 0.5,
+    def __init__(self, tendencies=None):
+        super().__init__("tendency")
+        self.tendencies = dict(_DEFAULT_TENDENCIES)
 
-            # Novelty Orientation (Routine ↔ Exploratory), Do I stick to known patterns?
-            "novelty": 0.5,
-        }
+        if tendencies is not None:
+            for k, v in tendencies.items():
+                self.set(k, v)
 
     def apply_geo_bias(self, geo_pressure):
         """
@@ -123,51 +184,23 @@ class TendencyComponent(Component):
         Expects keys: resource_stability, environmental_threat,
         mobility_constraint, population_density, isolation_level.
         """
-        # --- 1. Resource Stability ---
-        # Logic: Scarcity (negative stability) breeds impulsivity and caution.
-        # Abundance (positive stability) allows for long-term planning and social trust.
-        res_stab = geo_pressure.get("resource_stability", 0)
-        self.tendencies["patience"] += res_stab * 0.5
-        self.tendencies["social"] += res_stab * 0.3
-        self.tendencies["risk"] -= res_stab * 0.3
-
-        # --- 2. Environmental Threat ---
-        # Logic: High danger requires strict hierarchy and defensive readiness.
-        # Safety allows for exploration and lower aggression.
-        env_threat = geo_pressure.get("environmental_threat", 0)
-        self.tendencies["aggression"] += env_threat * 0.4
-        self.tendencies["authority"] += env_threat * 0.4
-        self.tendencies["novelty"] -= env_threat * 0.2
-
-        # --- 3. Mobility Constraint ---
-        # Logic: Hard terrain (mountains/deep water) creates isolated, routine-based cultures.
-        # Easy terrain encourages exploration and risk-taking.
-        mob_con = geo_pressure.get("mobility_constraint", 0)
-        self.tendencies["novelty"] -= mob_con * 0.2  # Hard to move = stick to routine
-        self.tendencies["risk"] -= mob_con * 0.3  # Hard to move = play it safe
-        self.tendencies["patience"] += mob_con * 0.2  # Life moves slower in hard terrain
-
-        # --- 4. Population Density ---
-        # Logic: High density increases social friction and the need for laws.
-        pop_dens = geo_pressure.get("population_density", 0)
-        self.tendencies["authority"] += pop_dens * 0.4
-        self.tendencies["aggression"] += pop_dens * 0.3
-        self.tendencies["novelty"] += pop_dens * 0.2  # Crowds drive people to look for new space
-
-        # --- 5. Isolation Level ---
-        # Logic: High isolation (no water/routes) forces local social cohesion.
-        # Connectivity (low isolation) encourages global authority and novelty.
-        iso_lvl = geo_pressure.get("isolation_level", 0)
-        self.tendencies["social"] += iso_lvl * 0.4  # Isolated groups must trust each other
-        self.tendencies["novelty"] -= iso_lvl * 0.4  # Isolated groups see less of the world
-        self.tendencies["authority"] += iso_lvl * 0.3  # Remote areas care less about central rules
-
-        # Final Clamp to range: -1.0 to 1.0
-        for k in self.tendencies:
-            self.tendencies[k] = max(-1.0, min(1.0, self.tendencies[k]))
+        # Plain Python: for one entity, NumPy call overhead outweighs the 30 multiply-adds
+        p0, p1, p2, p3, p4 = [geo_pressure.get(k, 0) for k in _GEO_KEYS]
+        t = self.tendencies
+
+        for k, (c0, c1, c2, c3, c4) in _GEO_BIAS_COLUMNS:
+            v = t[k] + p0 * c0 + p1 * c1 + p2 * c2 + p3 * c3 + p4 * c4
+
+            # Final Clamp to range: -1.0 to 1.0
+            t[k] = -1.0 if v < -1.0 else 1.0 if v > 1.0 else v
 
     def get(self, tendency):
         return self.tendencies.get(tendency, 0.5)
 
+    def set(self, tendency, value):
+        if tendency not in TENDENCY_INDEX:
+            raise KeyError(f"Unknown tendency axis: {tendency!r}")
+        self.tendencies[tendency] = value
+
     def to_json(self):
         return dict(self.tendencies)
@@ -1,5 +1,5 @@
 import math
-import pandas as pd
+import numpy as np
 
 
 
@@ -113,6 +113,80 @@ def map_vas_rbf_distribution(
 
 
 
+# Integer label codes, looked up in EMOTION_ANCHORS order so they follow the dict.
+# Batch mapping works on codes and decodes to strings once at the end.
+
+_LABELS = tuple(EMOTION_ANCHORS)
+
+LOVE       = _LABELS.index("Love/Ecstasy")
+EXCITEMENT = _LABELS.index("Excitement/Elation")
+ANGER      = _LABELS.index("Anger/Rage")
+FEAR       = _LABELS.index("Fear/Terror")
+DISTRESS   = _LABELS.index("Distress/Anxiety")
+DISGUST    = _LABELS.index("Disgust/Aversion")
+SADNESS    = _LABELS.index("Sadness/Grief")
+SERENITY   = _LABELS.index("Serenity/Contentment")
+CALMNESS   = _LABELS.index("Calmness/Apathy")
+RELAXATION = _LABELS.index("Relaxation")
+BOREDOM    = _LABELS.index("Boredom/Dullness")
+INTEREST   = _LABELS.index("Interest/Ambivalence")
+
+_ANCHOR_POINTS = np.array(list(EMOTION_ANCHORS.values()), dtype=np.float64)
+
+
+
+# Batch mapper.
+# The Gaussian RBF is strictly decreasing with distance and normalization
+# does not change the ranking, so the strongest emotion is simply the
+# nearest anchor. No exp, no branches: boolean masks over whole arrays.
+#
+# valence, arousal, sociality: same-shape arrays
+# returns: int8 array of label codes (decode with _LABELS)
+
+
+def map_vas_array(valence, arousal, sociality):
+    """
+    Maps separate V, A, S arrays to dominant emotion codes (int8).
+    """
+
+    valence = np.asarray(valence, dtype=np.float64)
+    arousal = np.asarray(arousal, dtype=np.float64)
+    sociality = np.asarray(sociality, dtype=np.float64)
+
+    emotion_codes = np.zeros(valence.shape, dtype=np.int8)
+    best_distance = np.full(valence.shape, np.inf)
+
+    # One vectorized pass per anchor, in EMOTION_ANCHORS order.
+    # Strictly-closer wins, so the first anchor keeps ties, same as max() over the dict.
+    for emotion_code, (anchor_v, anchor_a, anchor_s) in enumerate(_ANCHOR_POINTS):
+        squared_distance = (
+            (valence - anchor_v) ** 2 +
+            (arousal - anchor_a) ** 2 +
+            (sociality - anchor_s) ** 2
+        )
+
+        closer = squared_distance < best_distance
+        emotion_codes[closer] = emotion_code
+        np.minimum(best_distance, squared_distance, out=best_distance)
+
+    return emotion_codes
+
+
+def map_vas_batch(vas_points):
+    """
+    Maps many VAS points to their dominant emotion codes at once.
+    """
+
+    vas_points = np.asarray(vas_points, dtype=np.float64).reshape(-1, 3)
+
+    return map_vas_array(
+        vas_points[:, 0],
+        vas_points[:, 1],
+        vas_points[:, 2]
+    )
+
+
+
 # replacement for original IF/ELSE mapper.
 # Keeps the same function name and signature.
 # Returns the strongest emotion label.
@@ -120,24 +194,25 @@ def map_vas_rbf_distribution(
 
 def map_vas_to_label(valence, arousal, sociality):
     """
-    Returns the dominant emotion label using RBF competition.
+    Returns the dominant emotion label: the nearest emotion anchor.
     """
 
-    emotion_distribution = map_vas_rbf_distribution(
-        valence,
-        arousal,
-        sociality
-    )
+    agent_vas_point = (valence, arousal, sociality)
 
-    # Choose the emotion with the highest activation
-    return max(
-        emotion_distribution,
-        key=emotion_distribution.get
+    # Strongest activation == nearest anchor (see batch mapper above).
+    # Pure Python on purpose: numpy overhead dominates for a single point.
+    # min() keeps the first anchor on ties, same as the batch path.
+    return min(
+        EMOTION_ANCHORS,
+        key=lambda emotion_label: sum(
+            (agent_value - anchor_value) ** 2
+            for agent_value, anchor_value in zip(agent_vas_point, EMOTION_ANCHORS[emotion_label])
+        )
     )
 
 
 
-# Test. Unchanged Logically
+# Test. Scalar mapper per case, plus one batch mapper check over all cases
 
 def main():
     """Runs validation tests against known VAS cases."""
@@ -168,32 +243,52 @@ def main():
             sociality
         )
 
-        results.append({
-            "Test Case": case["Name"],
-            "V": valence,
-            "A": arousal,
-            "S": sociality,
-            "Expected Label": case["Expected"],
-            "Actual Label": predicted_label,
-            "Status": "PASS" if predicted_label == case["Expected"]
-                      else f"FAIL (Got: {predicted_label})"
-        })
+        results.append((
+            case["Name"],
+            valence,
+            arousal,
+            sociality,
+            case["Expected"],
+            predicted_label,
+            "PASS" if predicted_label == case["Expected"]
+            else f"FAIL (Got: {predicted_label})"
+        ))
+
+    # Batch mapper must agree with the expected labels for every case at once
+    batch_codes = map_vas_batch([(case["V"], case["A"], case["S"]) for case in test_cases])
+    batch_labels = [_LABELS[code] for code in batch_codes]
+    batch_mismatches = [
+        case["Name"]
+        for case, label in zip(test_cases, batch_labels)
+        if label != case["Expected"]
+    ]
 
-    df = pd.DataFrame(results)
+    headers = ("Test Case", "V", "A", "S", "Expected Label", "Actual Label", "Status")
 
-    pd.set_option("display.max_rows", None)
-    pd.set_option("display.max_columns", None)
-    pd.set_option("display.width", 1000)
+    # Column width = widest cell in that column (header included)
+    column_widths = [
+        max(len(str(cell)) for cell in column)
+        for column in zip(headers, *results)
+    ]
 
-    print(df.to_string(index=False))
+    for row in (headers, *results):
+        print("  ".join(
+            f"{str(cell):>{width}}"
+            for cell, width in zip(row, column_widths)
+        ))
 
-    failed_tests = df["Status"].str.startswith("FAIL").sum()
+    failed_tests = sum(1 for row in results if row[-1].startswith("FAIL"))
 
     print("\n--- Test Summary ---")
-    print(f"Total Tests Run: {len(df)}")
-    print(f"Total Tests Passed: {len(df) - failed_tests}")
+    print(f"Total Tests Run: {len(results)}")
+    print(f"Total Tests Passed: {len(results) - failed_tests}")
     print(f"Total Tests Failed: {failed_tests}")
-    print(f"Result: {'SUCCESS' if failed_tests == 0 else 'FAILURE'}")
+    print(
+        f"Batch Check: {len(test_cases) - len(batch_mismatches)}/{len(test_cases)} matched, "
+        + ("PASS" if not batch_mismatches
+           else f"FAIL (Mismatched: {', '.join(batch_mismatches)})")
+    )
+    print(f"Result: {'SUCCESS' if failed_tests == 0 and not batch_mismatches else 'FAILURE'}")
 
 
 if __name__ == "__main__":
@@ -8,9 +8,10 @@ Usage:
     PrintTradeRoutes(world, trade_links)
 """
 
-from texttable import Texttable
+import codecs
 import shutil
-from PIL import Image, ImageDraw
+import sys
+import numpy as np
 
 # Optional ANSI colors
 
@@ -45,6 +46,45 @@ COLOR_LIST = [
 ]
 RESET = "\033[0m"
 
+# Base tile colors for RenderTradeRouteMap
+TERRAIN_RGB = {
+    "plains":       (144, 238, 144),   # light green
+    "forest":       (34, 139, 34),     # forest green
+    "mountain":     (139, 137, 137),   # rocky grey
+    "settlement":   (240, 200, 80),    # warm yellow / town
+    "riverside":    (135, 206, 250),   # sky blue + land mix
+    "wetlands":     (102, 205, 170),   # teal wetland
+    "coastal":      (255, 228, 181),   # sand beach
+    "deep_water":   (25, 25, 112),     # deep navy blue
+    "dryland":      (210, 180, 140),   # tan dryland
+    "oasis":        (0, 191, 255),     # bright oasis blue
+    "river":        (100, 170, 240),   # same as river tag overlay
+}
+FALLBACK_RGB = (200, 200, 200)  # fallback grey
+
+# Terrain → small integer id, so per-tile lookups become array indexing.
+# Unknown terrains share the last id (fallback color).
+TERRAIN_ID = {t: i for i, t in enumerate(TERRAIN_RGB)}
+UNKNOWN_TERRAIN_ID = len(TERRAIN_ID)
+
+_PALETTE = np.array(list(TERRAIN_RGB.values()) + [FALLBACK_RGB], dtype=np.uint8)
+
+# Visually distinct route colors for RenderTradeRouteMap (simple palette)
+_ROUTE_PALETTE = np.array([
+    (220, 20, 60),   # red
+    (30, 144, 255),  # blue
+    (255, 140, 0),   # orange
+    (50, 205, 50),   # green
+    (138, 43, 226),  # purple
+    (255, 20, 147),  # pink
+], dtype=np.uint8)
+
+# ASCII lookup for PrintTradeRoutes, built once
+SYMBOL_BY_TERRAIN = tuple(SYMBOLS.get(t, "?") for t in TERRAIN_ID) + ("?",)
+
+# "00  ", "01  ", ... reused across renders
+_row_prefix = []
+
 
 # ------------------------------------------------------------
 # Helpers
@@ -55,13 +95,55 @@ def _route_color(idx):
         return ""
     return COLOR_LIST[idx % len(COLOR_LIST)]
 
-def _coord_map(world):
-    """Build a coordinate lookup for TileState so we can check if a tile is in a route path."""
-    cmap = {}
-    for row in world:
-        for tile in row:
-            cmap[(tile.x, tile.y)] = tile
-    return cmap
+def route_color(idx):
+    """RGB color of route idx in RenderTradeRouteMap."""
+    return tuple(_ROUTE_PALETTE[idx % len(_ROUTE_PALETTE)].tolist())
+
+def _terrain_grid(world):
+    """
+    (H, W) uint8 grid of TERRAIN_ID values.
+    world[y][x] is the tile at (x, y) (see GenerateWorld), so no coord lookup is needed.
+    """
+    return np.array(
+        [[TERRAIN_ID.get(tile.terrain, UNKNOWN_TERRAIN_ID) for tile in row] for row in world],
+        dtype=np.uint8
+    )
+
+# Last rendered (world, trade_links) → flattened routes + route grid.
+# Keyed by identity: UpdateTradeNetwork / UpdateTradeRouteRisks store a new
+# trade_links dict, so a fresh network is picked up automatically.
+_route_cache = {"world": None, "trade_links": None, "flat_routes": None, "route_grid": None}
+
+def InvalidateTradeRouteCache():
+    """Drop cached route data. Call after mutating trade_links in place."""
+    _route_cache.update(world=None, trade_links=None, flat_routes=None, route_grid=None)
+
+def _route_grid(world, trade_links):
+    """
+    Flatten trade_links and build an (H, W) int16 grid holding the first
+    route index passing through each tile (-1 = no route).
+    Cached until world or trade_links change.
+    """
+    if _route_cache["world"] is world and _route_cache["trade_links"] is trade_links:
+        return _route_cache["flat_routes"], _route_cache["route_grid"]
+
+    # Flatten routes and fill the grid in the same pass
+    flat_routes = []
+    route_grid = np.full((len(world), len(world[0])), -1, dtype=np.int16)
+    for links in trade_links.values():
+        for link in links:
+            idx = len(flat_routes)
+            flat_routes.append(link)
+
+            ys = np.array([tile.y for tile in link["path"]], dtype=np.intp)
+            xs = np.array([tile.x for tile in link["path"]], dtype=np.intp)
+
+            # First route to reach a tile keeps it
+            free = route_grid[ys, xs] == -1
+            route_grid[ys[free], xs[free]] = idx
+
+    _route_cache.update(world=world, trade_links=trade_links, flat_routes=flat_routes, route_grid=route_grid)
+    return flat_routes, route_grid
 
 
 # ------------------------------------------------------------
@@ -74,66 +156,70 @@ def PrintTradeRoutes(world, trade_links, show_ids=True, show_legend=True):
     Each route is drawn using a distinct color / ASCII mark.
     """
 
-    # Build (x,y) → list of route indices
-    route_map = {}
-    route_info = []
-
-    # Flatten routes
-    flat_routes = []
-    for sid, links in trade_links.items():
-        for link in links:
-            flat_routes.append(link)
-
-    for idx, link in enumerate(flat_routes):
-        color = _route_color(idx)
-        route_info.append((idx, link))
-        for tile in link["path"]:
-            route_map.setdefault((tile.x, tile.y), []).append(idx)
+    flat_routes, route_grid = _route_grid(world, trade_links)
 
     # -------------------------------------------------------
     # Print grid with overlay
     # -------------------------------------------------------
     height = len(world)
     width = len(world[0])
+    settlement_id = TERRAIN_ID["settlement"]
+
+    # Plain nested lists: per-tile reads are faster than NumPy scalar indexing
+    terrain_rows = _terrain_grid(world).tolist()
+    route_rows = route_grid.tolist()
+
+    # One glyph per route, so the tile loop is a plain list index
+    if USE_COLOR:
+        glyphs = [f"{_route_color(idx)}*{RESET}" for idx in range(len(flat_routes))]
+    else:
+        glyphs = ["*"] * len(flat_routes)
 
-    print("\n=== TRADE ROUTE MAP ===")
+    while len(_row_prefix) < height:
+        _row_prefix.append(f"{len(_row_prefix):02}  ")
 
-    # Print column numbers
-    print("    " + " ".join(f"{x:02}" for x in range(width)))
+    # Title and column numbers
+    rows = [
+        "\n=== TRADE ROUTE MAP ===",
+        "    " + " ".join(f"{x:02}" for x in range(width)),
+    ]
 
     for y, row in enumerate(world):
         line = []
-        for tile in row:
-            coord = (tile.x, tile.y)
-            t = tile.terrain
-
-            # Base map symbols
-            if t == "settlement":
-                base = "🏠"
-            elif tile.has_tag("river"):
-                base = "~"
-            else:
-                base = SYMBOLS.get(t, "?")
+        for x, tile in enumerate(row):
+            tid = terrain_rows[y][x]
+            rid = route_rows[y][x]
 
             # --- PATCH: GIVE SETTLEMENTS PRIORITY ---
             # Overlay logic
             # Always draw settlement icon first
-            if tile.terrain == "settlement":
+            if tid == settlement_id:
                 symbol = "🏠"
 
             # Otherwise draw trade routes if present
-            elif coord in route_map:
-                rid = route_map[coord][0]
-                color = _route_color(rid)
-                symbol = "*" if not USE_COLOR else f"{color}*{RESET}"
+            elif rid != -1:
+                symbol = glyphs[rid]
 
             # Otherwise fall back to base map symbol
+            elif tile.has_tag("river"):
+                symbol = "~"
             else:
-                symbol = base
+                symbol = SYMBOL_BY_TERRAIN[tid]
 
             line.append(symbol)
 
-        print(f"{y:02}  " + " ".join(line))
+        rows.append(_row_prefix[y] + " ".join(line))
+
+    # One write for the whole map. On a UTF-8 stdout, encode it once and write
+    # the bytes straight to the buffer; otherwise (IDE consoles, StringIO,
+    # other encodings) let the stream encode the text.
+    text = "\n".join(rows) + "\n"
+    out = getattr(sys.stdout, "buffer", None)
+    if out is not None and codecs.lookup(sys.stdout.encoding or "ascii").name == "utf-8":
+        sys.stdout.flush()  # keep order with text already printed
+        out.write(text.encode("utf-8"))
+    else:
+        sys.stdout.write(text)
 
     # -------------------------------------------------------
     # Legend
@@ -143,15 +229,11 @@ def PrintTradeRoutes(world, trade_links, show_ids=True, show_legend=True):
         for idx, link in enumerate(flat_routes):
             A = link["path"][0]
             B = link["path"][-1]
-            color = _route_color(idx)
             name = f"Route {idx}: ({A.x},{A.y}) → ({B.x},{B.y})"
             val = link["value"]
             risk = link["risk"]
 
-            if USE_COLOR:
-                print(f"{color}*{RESET} {name} | value={val:.2f} risk={risk:.2f}")
-            else:
-                print(f"* {name} | value={val:.2f} risk={risk:.2f}")
+            print(f"{glyphs[idx]} {name} | value={val:.2f} risk={risk:.2f}")
 
 def RenderTradeRouteMap(world, trade_links, tile_size=20, route_width=3, filename="trade_routes.png"):
     """
@@ -159,59 +241,30 @@ def RenderTradeRouteMap(world, trade_links, tile_size=20, route_width=3, filenam
     Each tile is a colored square, settlements are special icons,
     and trade routes are colored polylines.
     """
-
-    height = len(world)
-    width = len(world[0])
-
-    img_w = width * tile_size
-    img_h = height * tile_size
-
-    # Create blank canvas
-    img = Image.new("RGB", (img_w, img_h), (230, 230, 230))
-    draw = ImageDraw.Draw(img)
+    # Only the image renderer needs PIL; the ASCII overlay stays import-light
+    from PIL import Image, ImageDraw
 
     # -------------------------
     # 1. Draw base terrain tiles
     # -------------------------
-    def terrain_color(t):
-        return {
-            "plains":       (144, 238, 144),   # light green
-            "forest":       (34, 139, 34),     # forest green
-            "mountain":     (139, 137, 137),   # rocky grey
-            "settlement":   (240, 200, 80),    # warm yellow / town
-            "riverside":    (135, 206, 250),   # sky blue + land mix
-            "wetlands":     (102, 205, 170),   # teal wetland
-            "coastal":      (255, 228, 181),   # sand beach
-            "deep_water":   (25, 25, 112),     # deep navy blue
-            "dryland":      (210, 180, 140),   # tan dryland
-            "oasis":        (0, 191, 255),     # bright oasis blue
-            "river":        (100, 170, 240),   # same as river tag overlay
-        }.get(t, (200, 200, 200))  # fallback grey
+    terrain_grid = _terrain_grid(world)
+    river_mask = np.array([[tile.has_tag("river") for tile in row] for row in world], dtype=bool)
 
-    for y, row in enumerate(world):
-        for tile in row:
-            x = tile.x
-            y0 = tile.y
-            color = terrain_color(tile.terrain)
-
-            # Override if it has river tag
-            if tile.has_tag("river"):
-                color = (100, 170, 240)
-
-            draw.rectangle(
-                [
-                    x * tile_size,
-                    y0 * tile_size,
-                    x * tile_size + tile_size,
-                    y0 * tile_size + tile_size
-                ],
-                fill=color
-            )
+    # (H, W, 3) tile colors, river tag overrides the terrain color
+    color_grid = _PALETTE[terrain_grid]
+    color_grid[river_mask] = TERRAIN_RGB["river"]
+
+    # One pixel per tile, scaled up to tile_size blocks by PIL's nearest-neighbour resize
+    height, width = terrain_grid.shape
+    img = Image.fromarray(color_grid).resize((width * tile_size, height * tile_size), Image.NEAREST)
+    draw = ImageDraw.Draw(img)
 
-            # Settlement marker
+    # Settlement markers
+    for row in world:
+        for tile in row:
             if tile.terrain == "settlement":
-                cx = x * tile_size + tile_size // 2
-                cy = y0 * tile_size + tile_size // 2
+                cx = tile.x * tile_size + tile_size // 2
+                cy = tile.y * tile_size + tile_size // 2
                 r = tile_size // 3
                 draw.ellipse(
                     [cx - r, cy - r, cx + r, cy + r],
@@ -224,22 +277,7 @@ def RenderTradeRouteMap(world, trade_links, tile_size=20, route_width=3, filenam
     # 2. Draw trade routes
     # -------------------------
     # Flatten routes under consistent order
-    flat_routes = []
-    for sid, links in trade_links.items():
-        for link in links:
-            flat_routes.append(link)
-
-    def route_color(idx):
-        # generate visually distinct colors (simple palette)
-        palette = [
-            (220, 20, 60),   # red
-            (30, 144, 255),  # blue
-            (255, 140, 0),   # orange
-            (50, 205, 50),   # green
-            (138, 43, 226),  # purple
-            (255, 20, 147),  # pink
-        ]
-        return palette[idx % len(palette)]
+    flat_routes, _ = _route_grid(world, trade_links)
 
     for idx, link in enumerate(flat_routes):
         pts = []
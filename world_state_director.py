@@ -14,7 +14,7 @@ from dataclasses import dataclass, field
 from typing import Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class DirectorState:
     # Core world-level tension indicators
     global_stress: float = 0.0            # disasters, shortages, fear